@@ -1,37 +1,149 @@
 import pandas as pd
+import matplotlib
+# The plots are only written to PNG files, so skip probing for a GUI backend
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime
+import functools
 import numpy as np
 
 # Set style for better looking plots
-plt.style.use('seaborn')
-sns.set_palette("husl")
+plt.style.use('seaborn-v0_8')
 
-def load_data():
-    """Load and preprocess the CSV data."""
-    df = pd.read_csv('Resumes_Submissions_Submitted.csv')
-    
-    # Convert date string to datetime
-    df['Date'] = pd.to_datetime(df['Date'], format='%m/%d/%Y')
-    
-    return df
+def yes_mask(column):
+    """Mark the 'Y' rows of a categorical Y/N column by comparing its integer codes."""
+    categories = column.cat.categories
+    if 'Y' not in categories:
+        return np.zeros(len(column), dtype=bool)
+    return column.cat.codes.to_numpy() == categories.get_loc('Y')
+
+def load_data(chunksize=100_000):
+    """Stream the CSV data in preprocessed chunks."""
+    # Only read the columns we use, with their final dtypes, so pandas can
+    # skip type inference and parse the dates in the same pass
+    with pd.read_csv(
+        'Resumes_Submissions_Submitted.csv',
+        usecols=['Date', 'Company', 'Title', 'Quality', 'Local/Remote', 'Interviews', 'Recruiter'],
+        dtype={
+            'Company': 'string',
+            'Title': 'string',
+            'Local/Remote': 'category',
+            'Interviews': 'category',
+            'Recruiter': 'category',
+            'Quality': 'Int8'
+        },
+        parse_dates=['Date'],
+        date_format='%m/%d/%Y',
+        engine='c',
+        chunksize=chunksize
+    ) as reader:
+        for chunk in reader:
+            # Precompute the Y/N flags as boolean columns so callers don't have to
+            # repeat the string comparison
+            chunk['Interviews_Y'] = yes_mask(chunk['Interviews'])
+            chunk['Recruiter_Y'] = yes_mask(chunk['Recruiter'])
+            yield chunk
+
+def add_counts(total, counts):
+    """Add one chunk's group sizes to the running totals."""
+    if total is None:
+        return counts
+    return total.add(counts, fill_value=0)
+
+def outcome_table(sizes):
+    """Unstack group sizes into False/True interview outcome columns."""
+    return sizes.astype('int64').unstack('Interviews_Y', fill_value=0).reindex(
+        columns=[False, True], fill_value=0
+    )
 
-def plot_high_quality_interview_table(df):
+def summarize_data(chunks):
+    """Aggregate the data chunks into the counts used by the metrics, plots and analysis."""
+    # Only the group counts, the set of companies and the (rare) high quality
+    # interview rows are kept, so memory does not grow with the number of rows
+    monthly_sizes = quality_sizes = recruiter_sizes = location_counts = None
+    companies = set()
+    high_quality_interviews = []
+    
+    for chunk in chunks:
+        month = chunk['Date'].dt.to_period('M').rename('month')
+        monthly_sizes = add_counts(
+            monthly_sizes, chunk.groupby([month, 'Quality', 'Interviews_Y']).size()
+        )
+        quality_sizes = add_counts(quality_sizes, chunk.groupby(['Quality', 'Interviews_Y']).size())
+        recruiter_sizes = add_counts(
+            recruiter_sizes, chunk.groupby(['Recruiter_Y', 'Interviews_Y']).size()
+        )
+        location_counts = add_counts(location_counts, chunk['Local/Remote'].value_counts())
+        companies.update(chunk['Company'].dropna().unique())
+        
+        # Keep the high quality interviews for the table, filtered as a single
+        # expression (pandas hands it to numexpr when that is installed) and
+        # selecting the (few) matching rows by position
+        mask = chunk.eval('(Quality == 1 or Quality == 2) and Interviews_Y')
+        rows = np.flatnonzero(mask.to_numpy(dtype=bool, na_value=False))
+        if len(rows) > 0:
+            high_quality_interviews.append(chunk.iloc[rows])
+    
+    # Keep an empty frame with the right columns if nothing matched
+    if not high_quality_interviews:
+        high_quality_interviews.append(chunk.iloc[:0])
+    
+    return {
+        'monthly_counts': monthly_counts(monthly_sizes.astype('int64')),
+        'quality_outcomes': outcome_table(quality_sizes),
+        'recruiter_outcomes': outcome_table(recruiter_sizes).reindex([False, True], fill_value=0),
+        'location_counts': location_counts.astype('int64'),
+        'companies': companies,
+        'high_quality_interviews': pd.concat(high_quality_interviews).sort_values(
+            'Date', kind='mergesort'
+        )
+    }
+
+def monthly_counts(sizes):
+    """Arrange monthly group sizes into months by (Quality, Interviews_Y) columns."""
+    counts = sizes.unstack(['Quality', 'Interviews_Y'], fill_value=0)
+    
+    # Fill in months with no applications and every Quality/outcome pair so
+    # the plots can select columns without checking they exist
+    all_months = pd.period_range(counts.index.min(), counts.index.max(), freq='M')
+    all_columns = pd.MultiIndex.from_product(
+        [sorted(sizes.index.unique(level='Quality')), [False, True]],
+        names=['Quality', 'Interviews_Y']
+    )
+    return counts.reindex(index=all_months, columns=all_columns, fill_value=0)
+
+def active_months(counts):
+    """Trim the leading and trailing months that have no counts."""
+    totals = counts.to_numpy().reshape(len(counts), -1).sum(axis=1)
+    active = np.flatnonzero(totals)
+    if len(active) == 0:
+        return counts.iloc[:0]
+    return counts.iloc[active[0]:active[-1] + 1]
+
+def month_labels(months):
+    """Format a contiguous monthly PeriodIndex as 'Month Year' tick labels."""
+    if len(months) == 0:
+        return []
+    return list(_month_labels(months[0].ordinal, len(months)))
+
+@functools.cache
+def _month_labels(first_month, n_months):
+    # Keyed on plain ints so both monthly plots share the formatted labels
+    months = pd.period_range(pd.Period(ordinal=first_month, freq='M'), periods=n_months, freq='M')
+    return tuple(months.strftime('%B %Y'))
+
+def plot_high_quality_interview_table(high_quality_interviews):
     """Create a table visualization of high-quality jobs (Quality 1-2) that resulted in interviews."""
-    # Filter for high quality interviews
-    mask = (df['Quality'].isin([1, 2])) & (df['Interviews'] == 'Y')
-    high_quality_interviews = df[mask].copy()
-    
-    # Sort by date
-    high_quality_interviews = high_quality_interviews.sort_values('Date')
-    
-    # Format date for display
-    high_quality_interviews['Date'] = high_quality_interviews['Date'].dt.strftime('%m/%d/%Y')
-    
-    # Select and rename columns for display
+    # Gather the display columns straight into the table rows (already
+    # filtered and sorted by date in summarize_data)
     display_cols = ['Date', 'Company', 'Title', 'Quality', 'Local/Remote']
-    table_data = high_quality_interviews[display_cols].values
+    table_data = np.column_stack([
+        high_quality_interviews['Date'].dt.strftime('%m/%d/%Y').to_numpy(),
+        high_quality_interviews['Company'].to_numpy(),
+        high_quality_interviews['Title'].to_numpy(),
+        high_quality_interviews['Quality'].to_numpy(),
+        high_quality_interviews['Local/Remote'].to_numpy()
+    ])
     
     # Create figure and axis
     fig, ax = plt.subplots(figsize=(15, len(table_data) * 0.5 + 1))  # Adjust height based on number of rows
@@ -57,12 +169,11 @@ def plot_high_quality_interview_table(df):
         table[(0, i)].set_facecolor('#E6E6E6')
         table[(0, i)].set_text_props(weight='bold')
     
-    # Color rows based on Quality
-    for i in range(len(table_data)):
-        quality = table_data[i][3]  # Quality column
-        row_color = '#E8F5E9' if quality == 1 else '#FFF9C4'  # Light green for Q1, light yellow for Q2
+    # Color rows based on Quality: light green for Q1, light yellow for Q2
+    row_colors = np.where(table_data[:, 3].astype(int) == 1, '#E8F5E9', '#FFF9C4')
+    for i, row_color in enumerate(row_colors, start=1):
         for j in range(len(display_cols)):
-            table[(i + 1, j)].set_facecolor(row_color)
+            table[(i, j)].set_facecolor(row_color)
     
     # Adjust cell heights
     table.scale(1, 1.5)
@@ -74,16 +185,22 @@ def plot_high_quality_interview_table(df):
     plt.savefig('high_quality_interview_table.png', bbox_inches='tight', dpi=300)
     plt.close()
 
-def generate_basic_metrics(df):
+def generate_basic_metrics(summary):
     """Generate basic metrics about the job search."""
+    # Every row has a recruiter and interview outcome, so their counts cover
+    # all applications
+    recruiter_outcomes = summary['recruiter_outcomes']
+    quality_totals = summary['quality_outcomes'].sum(axis=1)
+    location_counts = summary['location_counts']
+    
     metrics = {
-        'Total Applications': len(df),
-        'Unique Companies': df['Company'].nunique(),
-        'Applications with Interviews': len(df[df['Interviews'] == 'Y']),
-        'Applications with Recruiters': len(df[df['Recruiter'] == 'Y']),
-        'Remote Positions': len(df[df['Local/Remote'] == 'Remote']),
-        'Local Positions': len(df[df['Local/Remote'] == 'Local']),
-        'Average Quality Score': df['Quality'].mean()
+        'Total Applications': int(recruiter_outcomes.to_numpy().sum()),
+        'Unique Companies': len(summary['companies']),
+        'Applications with Interviews': int(recruiter_outcomes[True].sum()),
+        'Applications with Recruiters': int(recruiter_outcomes.loc[True].sum()),
+        'Remote Positions': int(location_counts.get('Remote', 0)),
+        'Local Positions': int(location_counts.get('Local', 0)),
+        'Average Quality Score': float(np.average(quality_totals.index.astype(float), weights=quality_totals))
     }
     
     print("\n=== Basic Metrics ===")
@@ -93,172 +210,160 @@ def generate_basic_metrics(df):
         else:
             print(f"{metric}: {value}")
 
-def plot_applications_over_time(df):
+def plot_applications_over_time(counts, ax):
     """Create a plot showing applications over time."""
-    plt.figure(figsize=(12, 6))
-    
-    # Create applications per month
-    monthly_apps = df.resample('M', on='Date').size()
-    
-    plt.plot(monthly_apps.index, monthly_apps.values, marker='o')
-    plt.title('Applications Submitted Over Time')
-    plt.xlabel('Date')
-    plt.ylabel('Number of Applications')
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.savefig('applications_over_time.png')
-    plt.close()
+    fig = ax.figure
+    fig.set_size_inches(12, 6)
+    
+    # Create applications per month, plotted at the end of each month
+    monthly_apps = counts.sum(axis=1)
+    month_ends = monthly_apps.index.to_timestamp(how='end').normalize()
+    
+    ax.plot(month_ends, monthly_apps.values, marker='o')
+    ax.set_title('Applications Submitted Over Time')
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Number of Applications')
+    for label in ax.get_xticklabels():
+        label.set_rotation(45)
+    fig.savefig('applications_over_time.png', dpi=100)
+    ax.clear()
 
-def plot_interviews_per_month(df):
+def plot_interviews_per_month(counts, ax):
     """Create a plot showing interviews per month."""
-    plt.figure(figsize=(12, 6))
+    fig = ax.figure
+    fig.set_size_inches(12, 6)
     
-    # Create a mask for interviews
-    interviews_mask = df['Interviews'] == 'Y'
-    
-    # Get interviews per month
-    monthly_interviews = df[interviews_mask].resample('M', on='Date').size()
+    # Get interviews per month, from the first month with an interview to the last
+    interviews = counts.xs(True, level='Interviews_Y', axis=1)
+    monthly_interviews = active_months(interviews.sum(axis=1))
     
     # Create x-axis labels with month names
-    month_labels = monthly_interviews.index.strftime('%B %Y')
+    tick_labels = month_labels(monthly_interviews.index)
     
     # Create x-axis positions
     x_positions = range(len(monthly_interviews))
     
     # Plot the data
-    plt.bar(x_positions, monthly_interviews.values, color='green', alpha=0.7)
-    plt.title('Interviews Per Month')
-    plt.xlabel('Month')
-    plt.ylabel('Number of Interviews')
+    bars = ax.bar(x_positions, monthly_interviews.values, color='green', alpha=0.7)
+    ax.set_title('Interviews Per Month')
+    ax.set_xlabel('Month')
+    ax.set_ylabel('Number of Interviews')
     
     # Set x-axis ticks and labels
-    plt.xticks(x_positions, month_labels, rotation=45, ha='right')
+    ax.set_xticks(x_positions, tick_labels, rotation=45, ha='right')
     
-    # Add value labels on top of each bar
-    for i, v in enumerate(monthly_interviews.values):
-        if v > 0:  # Only add label if there were interviews
-            plt.text(i, v, str(int(v)), 
-                    ha='center', va='bottom')
+    # Add value labels on top of each bar, only where there were interviews
+    ax.bar_label(
+        bars, labels=[f'{int(v)}' if v > 0 else '' for v in monthly_interviews.values], padding=2
+    )
     
-    # Adjust layout to prevent label cutoff
-    plt.subplots_adjust(bottom=0.2)
-    plt.tight_layout()
-    plt.savefig('interviews_per_month.png')
-    plt.close()
+    fig.savefig('interviews_per_month.png', dpi=100)
+    ax.clear()
 
-def plot_high_quality_interviews_per_month(df):
+def plot_high_quality_interviews_per_month(counts, ax):
     """Create a plot showing interviews per month for positions with Quality 1 or 2."""
-    plt.figure(figsize=(12, 6))
-    
-    # Filter for interviews only
-    interviews_df = df[df['Interviews'] == 'Y'].copy()
-    
-    # Create separate dataframes for Quality 1 and 2
-    q1_interviews = interviews_df[interviews_df['Quality'] == 1]
-    q2_interviews = interviews_df[interviews_df['Quality'] == 2]
-    
-    # Get monthly counts for each quality
-    monthly_q1 = q1_interviews.resample('M', on='Date').size()
-    monthly_q2 = q2_interviews.resample('M', on='Date').size()
+    fig = ax.figure
+    fig.set_size_inches(12, 6)
     
-    # Ensure both series have the same index
-    all_months = sorted(list(set(monthly_q1.index) | set(monthly_q2.index)))
-    monthly_q1 = monthly_q1.reindex(all_months, fill_value=0)
-    monthly_q2 = monthly_q2.reindex(all_months, fill_value=0)
+    # Get monthly interview counts for Quality 1 and 2; both columns share the
+    # count table's month index, so no per-quality reindexing is needed
+    interviews = counts.xs(True, level='Interviews_Y', axis=1)
+    high_quality = active_months(interviews.reindex(columns=[1, 2], fill_value=0))
+    monthly_q1 = high_quality[1].to_numpy()
+    monthly_q2 = high_quality[2].to_numpy()
+    all_months = high_quality.index
     
     # Create x-axis labels and positions
-    month_labels = [d.strftime('%B %Y') for d in all_months]
-    x_positions = range(len(all_months))
+    tick_labels = month_labels(all_months)
+    x_positions = np.arange(len(all_months))
     
     # Create the stacked bar chart - Quality 2 at bottom, Quality 1 on top
-    plt.bar(x_positions, monthly_q2.values, color='yellow', alpha=0.7, label='Quality 2')
-    plt.bar(x_positions, monthly_q1.values, bottom=monthly_q2.values, color='green', alpha=0.7, label='Quality 1')
+    ax.bar(x_positions, monthly_q2, color='yellow', alpha=0.7, label='Quality 2')
+    top_bars = ax.bar(x_positions, monthly_q1, bottom=monthly_q2, color='green', alpha=0.7, label='Quality 1')
     
-    plt.title('High Quality Interviews Per Month')
-    plt.xlabel('Month')
-    plt.ylabel('Number of Interviews')
-    plt.legend()
+    ax.set_title('High Quality Interviews Per Month')
+    ax.set_xlabel('Month')
+    ax.set_ylabel('Number of Interviews')
+    ax.legend()
     
     # Set x-axis ticks and labels
-    plt.xticks(x_positions, month_labels, rotation=45, ha='right')
-    
-    # Add value labels on top of bars
-    for i in range(len(all_months)):
-        q1_val = monthly_q1.values[i]
-        q2_val = monthly_q2.values[i]
-        total = q1_val + q2_val
-        
-        if total > 0:
-            # If there's a mix of qualities, show both numbers
-            if q1_val > 0 and q2_val > 0:
-                plt.text(i, total, f'Q1:{int(q1_val)}\nQ2:{int(q2_val)}', 
-                        ha='center', va='bottom')
-            # If it's only Quality 1
-            elif q1_val > 0:
-                plt.text(i, q1_val, str(int(q1_val)), 
-                        ha='center', va='bottom')
-            # If it's only Quality 2
-            elif q2_val > 0:
-                plt.text(i, q2_val, str(int(q2_val)), 
-                        ha='center', va='bottom')
-    
-    # Adjust layout to prevent label cutoff
-    plt.subplots_adjust(bottom=0.2)
-    plt.tight_layout()
-    plt.savefig('high_quality_interviews_per_month.png')
-    plt.close()
+    ax.set_xticks(x_positions, tick_labels, rotation=45, ha='right')
+    
+    # Add value labels on top of the stacked bars: both numbers if there's a
+    # mix of qualities, otherwise just the one count. Classify every month at
+    # once (bit 0 = has Q1, bit 1 = has Q2) and pick the matching template.
+    label_templates = ['', '{q1}', '{q2}', 'Q1:{q1}\nQ2:{q2}']
+    label_kinds = (monthly_q1 > 0).astype(np.int8) | ((monthly_q2 > 0).astype(np.int8) << 1)
+    labels = [
+        label_templates[kind].format(q1=int(q1_val), q2=int(q2_val))
+        for kind, q1_val, q2_val in zip(label_kinds, monthly_q1, monthly_q2)
+    ]
+    ax.bar_label(top_bars, labels=labels, padding=2)
+    
+    fig.savefig('high_quality_interviews_per_month.png', dpi=100)
+    ax.clear()
 
-def plot_quality_distribution(df):
+def plot_quality_distribution(quality_outcomes, ax):
     """Create a plot showing the distribution of job quality ratings."""
-    plt.figure(figsize=(10, 6))
-    
-    sns.countplot(data=df, x='Quality')
-    plt.title('Distribution of Job Quality Ratings')
-    plt.xlabel('Quality Rating')
-    plt.ylabel('Number of Applications')
-    plt.tight_layout()
-    plt.savefig('quality_distribution.png')
-    plt.close()
+    fig = ax.figure
+    fig.set_size_inches(10, 6)
+    
+    # Count each quality rating
+    qualities = quality_outcomes.index.to_numpy(dtype=np.int8)
+    quality_counts = quality_outcomes.sum(axis=1).to_numpy()
+    
+    ax.bar(qualities, quality_counts)
+    ax.set_xticks(qualities)
+    ax.set_title('Distribution of Job Quality Ratings')
+    ax.set_xlabel('Quality Rating')
+    ax.set_ylabel('Number of Applications')
+    fig.savefig('quality_distribution.png', dpi=100)
+    ax.clear()
 
-def analyze_interview_success(df):
+def analyze_interview_success(summary):
     """Analyze factors related to interview success."""
     print("\n=== Interview Success Analysis ===")
     
-    # Interview rate by quality
-    interview_rate_by_quality = df.groupby('Quality')['Interviews'].apply(
-        lambda x: (x == 'Y').mean() * 100
-    )
+    # Interview rate by quality, as interview count over group size
+    quality_outcomes = summary['quality_outcomes']
+    interview_rate_by_quality = quality_outcomes[True] / quality_outcomes.sum(axis=1) * 100
     print("\nInterview Rate by Quality Rating:")
-    for quality, rate in interview_rate_by_quality.items():
-        print(f"Quality {quality}: {rate:.1f}%")
+    print("\n".join(
+        f"Quality {quality}: {rate:.1f}%" for quality, rate in interview_rate_by_quality.items()
+    ))
     
-    # Interview rate with/without recruiter
-    recruiter_interview_rate = df[df['Recruiter'] == 'Y']['Interviews'].apply(
-        lambda x: x == 'Y'
-    ).mean() * 100
-    no_recruiter_interview_rate = df[df['Recruiter'] == 'N']['Interviews'].apply(
-        lambda x: x == 'Y'
-    ).mean() * 100
+    # Interview rate with/without recruiter, both from the same counts
+    recruiter_outcomes = summary['recruiter_outcomes']
+    interview_rate_by_recruiter = recruiter_outcomes[True] / recruiter_outcomes.sum(axis=1) * 100
+    recruiter_interview_rate = interview_rate_by_recruiter.get(True, np.nan)
+    no_recruiter_interview_rate = interview_rate_by_recruiter.get(False, np.nan)
     
     print(f"\nInterview Rate with Recruiter: {recruiter_interview_rate:.1f}%")
     print(f"Interview Rate without Recruiter: {no_recruiter_interview_rate:.1f}%")
 
 def main():
-    # Load the data
-    df = load_data()
+    # Stream the data, aggregating everything the report needs in one pass
+    summary = summarize_data(load_data())
     
     # Generate and display metrics
-    generate_basic_metrics(df)
-    
-    # Create visualizations
-    plot_applications_over_time(df)
-    plot_quality_distribution(df)
-    plot_interviews_per_month(df)
-    plot_high_quality_interviews_per_month(df)
-    plot_high_quality_interview_table(df)  # Added new visualization
+    generate_basic_metrics(summary)
+    
+    # The monthly counts are shared by all of the monthly plots
+    counts = summary['monthly_counts']
+    
+    # Create visualizations, reusing one figure for the charts; each plot
+    # saves its image and clears the axes for the next one, and the tight
+    # layout is applied whenever a chart is saved
+    fig, ax = plt.subplots(figsize=(12, 6), layout='tight')
+    plot_applications_over_time(counts, ax)
+    plot_quality_distribution(summary['quality_outcomes'], ax)
+    plot_interviews_per_month(counts, ax)
+    plot_high_quality_interviews_per_month(counts, ax)
+    plt.close(fig)
+    plot_high_quality_interview_table(summary['high_quality_interviews'])  # Added new visualization
     
     # Analyze interview success
-    analyze_interview_success(df)
+    analyze_interview_success(summary)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file